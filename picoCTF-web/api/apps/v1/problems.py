@@ -66,12 +66,14 @@ class ProblemList(Resource):
 
         # Add the unlocked, solved, review, and container fields
         curr_user = api.user.get_user()
+        tid = curr_user["tid"]
+        unlocked_pids = set(api.problem.get_unlocked_pids(tid))
+        solved_pids = set(api.problem.get_solved_pids(tid=tid))
         for problem in problems:
             pid = problem["pid"]
-            tid = curr_user["tid"]
             problem["solves"] = api.stats.get_problem_solves(pid)
-            problem["unlocked"] = pid in api.problem.get_unlocked_pids(tid)
-            problem["solved"] = pid in api.problem.get_solved_pids(tid=tid)
+            problem["unlocked"] = pid in unlocked_pids
+            problem["solved"] = pid in solved_pids
             if curr_user.get("admin", False):
                 problem["reviews"] = api.problem_feedback.get_problem_feedback(
                     pid=pid, count_only=True
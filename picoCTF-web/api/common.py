@@ -66,6 +66,10 @@ def check(*callback_tuples):
         Returns a function callback for the Schema
 
     """
+    # Flatten once when the schema is built rather than on every validation
+    checks = [
+        (msg, callback) for msg, callbacks in callback_tuples for callback in callbacks
+    ]
 
     def v(value):
         """
@@ -79,14 +83,13 @@ def check(*callback_tuples):
             The value if the validation callbacks are satisfied.
 
         """
-        for msg, callbacks in callback_tuples:
-            for callback in callbacks:
-                try:
-                    result = callback(value)
-                    if not result and type(result) == bool:
-                        raise Invalid()
-                except Exception:
-                    raise PicoException(msg, 400)
+        for msg, callback in checks:
+            try:
+                result = callback(value)
+                if not result and type(result) == bool:
+                    raise Invalid()
+            except Exception:
+                raise PicoException(msg, 400)
         return value
 
     return v
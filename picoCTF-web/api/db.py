@@ -25,7 +25,7 @@ def get_conn():
 
     """
     global __client, __connection
-    if not __connection:
+    if __connection is None:
         conf = current_app.config
         if conf["MONGO_USER"] and conf["MONGO_PW"]:
             uri = "mongodb://{}:{}@{}:{}/{}?authMechanism=SCRAM-SHA-1".format(
@@ -78,11 +78,22 @@ def get_conn():
             [("owner", 1), ("name", 1)], unique=True, name="name and owner"
         )
 
+        __connection.bundles.create_index("bid", unique=True, name="unique bid")
+
+        __connection.images.create_index("pid")
+
         __connection.problems.create_index("pid", unique=True, name="unique pid")
         __connection.problems.create_index("disabled")
         __connection.problems.create_index(
             [("score", pymongo.ASCENDING), ("name", pymongo.ASCENDING)]
         )
+        __connection.problems.create_index(
+            [
+                ("disabled", pymongo.ASCENDING),
+                ("score", pymongo.ASCENDING),
+                ("name", pymongo.ASCENDING),
+            ]
+        )
 
         __connection.scoreboards.create_index(
             "sid", unique=True, name="unique scoreboard sid"
@@ -100,6 +111,7 @@ def get_conn():
         __connection.submissions.create_index("uid")
         __connection.submissions.create_index("tid")
         __connection.submissions.create_index("suspicious")
+        __connection.submissions.create_index([("tid", 1), ("suspicious", 1)])
 
         __connection.teams.create_index(
             "team_name", unique=True, name="unique team_names"
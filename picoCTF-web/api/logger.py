@@ -39,7 +39,7 @@ class FunctionLoggingHandler(logging.StreamHandler):
                 {
                     "event": result["name"],
                     "args": result["args"],
-                    "time": datetime.now(),
+                    "time": datetime.utcnow(),
                 }
             )
 
@@ -67,7 +67,7 @@ class ExceptionHandler(logging.StreamHandler):
         information.update(
             {
                 "id": api.common.token(),
-                "time": datetime.now(),
+                "time": datetime.utcnow(),
                 "message": record.msg,
                 "trace": traceback.format_exc(),
                 "visible": True,
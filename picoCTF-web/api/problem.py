@@ -78,15 +78,14 @@ def get_all_categories():
     return db.problems.find(match).distinct("category")
 
 
-def upsert_problem(problem, sid):
+def _prepare_problem(problem, sid, server_number):
     """
-    Add or update a problem.
+    Validate a published problem and fill in its server-side fields.
 
     Args:
         problem: problem dict
         sid: shell server ID
-    Returns:
-        The created/updated problem ID.
+        server_number: the shell server's number, if any
     """
     db = api.db.get_conn()
 
@@ -103,7 +102,6 @@ def upsert_problem(problem, sid):
     problem["disabled"] = True
 
     # Assign instance IDs and server numbers
-    server_number = api.shell_servers.get_server(sid)["server_number"]
     for instance in problem["instances"]:
         instance["iid"] = api.common.hash(
             str(instance["instance_number"]) + sid + problem["pid"]
@@ -139,8 +137,19 @@ def upsert_problem(problem, sid):
     else:
         problem["has_walkthrough"] = False
 
+
+def _get_problem_write(problem, sid, existing):
+    """
+    Build the write operation which stores a prepared problem.
+
+    Args:
+        problem: problem dict, as prepared by _prepare_problem
+        sid: shell server ID
+        existing: the stored version of the problem, or None if it is new
+    Returns:
+        A pymongo write operation suitable for bulk_write
+    """
     # If the problem already exists, update it instead
-    existing = db.problems.find_one({"pid": problem["pid"]}, {"_id": 0})
     if existing is not None:
         # Copy over instances on other shell servers from the existing version
         other_server_instances = [i for i in existing["instances"] if i["sid"] != sid]
@@ -150,10 +159,30 @@ def upsert_problem(problem, sid):
         # set to true if there are no instances
         problem["disabled"] = existing["disabled"] or len(problem["instances"]) == 0
 
-        db.problems.find_one_and_update({"pid": problem["pid"]}, {"$set": problem})
-        return problem["pid"]
+        return pymongo.UpdateOne({"pid": problem["pid"]}, {"$set": problem})
+
+    return pymongo.InsertOne(problem)
+
+
+def upsert_problem(problem, sid):
+    """
+    Add or update a problem.
+
+    Args:
+        problem: problem dict
+        sid: shell server ID
+    Returns:
+        The created/updated problem ID.
+    """
+    db = api.db.get_conn()
+
+    server_number = api.shell_servers.get_server(sid)["server_number"]
+    _prepare_problem(problem, sid, server_number)
 
-    db.problems.insert(problem)
+    existing = db.problems.find_one(
+        {"pid": problem["pid"]}, {"_id": 0, "instances": 1, "disabled": 1}
+    )
+    db.problems.bulk_write([_get_problem_write(problem, sid, existing)])
     return problem["pid"]
 
 
@@ -171,7 +200,7 @@ def assign_instance_to_team(pid, tid=None, reassign=False):
 
     """
     team = api.team.get_team(tid=tid)
-    problem = get_problem(pid)
+    problem = get_problem(pid, {"instances": 1})
 
     available_instances = problem["instances"]
 
@@ -201,10 +230,9 @@ def assign_instance_to_team(pid, tid=None, reassign=False):
     instance_number = randint(0, len(available_instances) - 1)
     iid = available_instances[instance_number]["iid"]
 
-    team["instances"][pid] = iid
-
+    # Only set this assignment, rather than rewriting the whole team document
     db = api.db.get_conn()
-    db.teams.update({"tid": tid}, {"$set": team})
+    db.teams.update_one({"tid": tid}, {"$set": {"instances." + pid: iid}})
 
     return instance_number
 
@@ -222,7 +250,7 @@ def get_instance_data(pid, tid):
 
     """
     instance_map = api.team.get_team(tid=tid)["instances"]
-    problem = get_problem(pid)
+    problem = get_problem(pid, {"instances": 1})
 
     if pid not in instance_map:
         iid = assign_instance_to_team(pid, tid)
@@ -328,43 +356,59 @@ def get_solved_problems(tid=None, uid=None, category=None, show_disabled=False):
 
     members = api.team.get_team_uids(tid=team["tid"])
 
-    submissions = api.submissions.get_submissions(
-        tid=tid, uid=uid, category=category, correctness=True
-    )
+    # Correct submissions by the team or user, or by any current team member
+    entity_match = {}
+    if uid is not None:
+        entity_match.update({"uid": uid})
+    elif tid is not None:
+        entity_match.update({"tid": tid})
+
+    match = {"$or": [entity_match, {"uid": {"$in": members}}], "correct": True}
+    if category is not None:
+        match.update({"category": category})
 
-    for uid in members:
-        submissions += api.submissions.get_submissions(
-            uid=uid, category=category, correctness=True
+    # Find the earliest solve time of each pid server-side
+    db = api.db.get_conn()
+    pid_times = {
+        solve["_id"]: solve["solve_time"]
+        for solve in db.submissions.aggregate(
+            [
+                {"$match": match},
+                {"$group": {"_id": "$pid", "solve_time": {"$min": "$timestamp"}}},
+                {"$sort": {"solve_time": pymongo.ASCENDING}},
+            ]
         )
+    }
 
-    pid_times = {}
-    result = []
+    # Fetch all of the solved problems in a single query
+    match = {"pid": {"$in": list(pid_times)}}
+    if not show_disabled:
+        match.update({"disabled": False})
+    problems = {
+        problem["pid"]: problem
+        for problem in db.problems.find(
+            match,
+            {
+                "_id": 0,
+                "pid": 1,
+                "unique_name": 1,
+                "score": 1,
+                "name": 1,
+                "disabled": 1,
+                "category": 1,
+            },
+        )
+    }
 
-    # Team submissions will take precedence because they appear first
-    # in the submissions list.
-    for submission in submissions:
-        pid = submission["pid"]
-        if pid not in pid_times:
-            problem = get_problem(
-                pid,
-                {
-                    "pid": 1,
-                    "unique_name": 1,
-                    "score": 1,
-                    "name": 1,
-                    "disabled": 1,
-                    "category": 1,
-                },
+    # Keep the problems ordered by solve time
+    result = []
+    for pid, solve_time in pid_times.items():
+        problem = problems.get(pid)
+        if problem is not None:
+            problem.update(
+                {"solved": True, "unlocked": True, "solve_time": solve_time}
             )
-            if problem is not None:
-                problem.update({"solved": True, "unlocked": True})
-                if not problem["disabled"] or show_disabled:
-                    result.append(problem)
-                pid_times[pid] = submission["timestamp"]
-        else:
-            pid_times[pid] = min(submission["timestamp"], pid_times.get(pid))
-    for p in result:
-        p["solve_time"] = pid_times[p["pid"]]
+            result.append(problem)
     return result
 
 
@@ -381,7 +425,7 @@ def get_solved_pids(*args, **kwargs):
     return [problem["pid"] for problem in get_solved_problems(*args, **kwargs)]
 
 
-def is_problem_unlocked(problem, solved):
+def is_problem_unlocked(problem, solved_pids, bundles=None):
     """
     Check whether the specified problem is unlocked.
 
@@ -392,16 +436,22 @@ def is_problem_unlocked(problem, solved):
 
     Args:
         problem: the problem object to check
-        solved: the list of solved problem objects
+        solved_pids: the set of solved problem ids
+        bundles (optional): the bundles to check, fetched if not provided
     """
     unlocked = True
 
-    for bundle in api.bundles.get_all_bundles():
+    if bundles is None:
+        bundles = api.bundles.get_all_bundles()
+
+    for bundle in bundles:
         if "dependencies" in bundle and bundle["dependencies_enabled"]:
             if problem["unique_name"] in bundle["dependencies"]:
                 dependency = bundle["dependencies"][problem["unique_name"]]
                 weightsum = sum(
-                    dependency["weightmap"].get(p["unique_name"], 0) for p in solved
+                    weight
+                    for pid, weight in dependency["weightmap"].items()
+                    if pid in solved_pids
                 )
                 if weightsum < dependency["threshold"]:
                     unlocked = False
@@ -424,14 +474,16 @@ def get_unlocked_pids(tid):
 
     """
     # Note: Do NOT limit solved problems to category for proper weight count
-    solved = get_solved_problems(tid=tid)
+    # Problem pids are their unique names, which is what weightmaps refer to
+    solved_pids = set(get_solved_pids(tid=tid))
     team = api.team.get_team(tid)
+    bundles = api.bundles.get_all_bundles()
 
     unlocked = []
     db = api.db.get_conn()
-    all_problems = list(db.problems.find({}, {"unique_name": 1, "pid": 1}))
-    for problem in all_problems:
-        if is_problem_unlocked(problem, solved):
+    # Consume the cursor directly, as the problems are only iterated once
+    for problem in db.problems.find({}, {"_id": 0, "unique_name": 1, "pid": 1}):
+        if is_problem_unlocked(problem, solved_pids, bundles):
             unlocked.append(problem["pid"])
 
     for pid in unlocked:
@@ -447,8 +499,30 @@ def load_published(data):
     Args:
         data: The output of "shell_manager publish"
     """
-    for problem in data["problems"]:
-        upsert_problem(problem, sid=data["sid"])
+    db = api.db.get_conn()
+    sid = data["sid"]
+    problems = data["problems"]
+
+    server_number = api.shell_servers.get_server(sid)["server_number"]
+    for problem in problems:
+        _prepare_problem(problem, sid, server_number)
+
+    # Look up all of the previously loaded problems at once
+    existing = {
+        problem["pid"]: problem
+        for problem in db.problems.find(
+            {"pid": {"$in": [problem["pid"] for problem in problems]}},
+            {"_id": 0, "pid": 1, "instances": 1, "disabled": 1},
+        )
+    }
+
+    writes = []
+    for problem in problems:
+        writes.append(_get_problem_write(problem, sid, existing.get(problem["pid"])))
+        # A later copy of the same problem in this blob updates this one
+        existing[problem["pid"]] = problem
+    if len(writes) > 0:
+        db.problems.bulk_write(writes)
 
     if "bundles" in data:
         for bundle in data["bundles"]:
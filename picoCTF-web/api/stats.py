@@ -252,10 +252,19 @@ def get_problem_submission_stats(pid=None):
     Returns:
         Dict of {valid: #, invalid: #}
     """
-    return {
-        "valid": len(api.submissions.get_submissions(pid, correctness=True)),
-        "invalid": len(api.submissions.get_submissions(pid, correctness=False)),
-    }
+    db = api.db.get_conn()
+    match = {}
+    if pid is not None:
+        match.update({"pid": pid})
+
+    # Count both outcomes in one round trip instead of fetching submissions
+    counts = {True: 0, False: 0}
+    for group in db.submissions.aggregate(
+        [{"$match": match}, {"$group": {"_id": "$correct", "count": {"$sum": 1}}}]
+    ):
+        counts[group["_id"]] = group["count"]
+
+    return {"valid": counts[True], "invalid": counts[False]}
 
 
 @memoize(timeout=3 * 24 * 60 * 60)
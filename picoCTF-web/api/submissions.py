@@ -41,7 +41,6 @@ def grade_problem(pid, key, tid=None):
     if tid is None:
         tid = api.user.get_user()["tid"]
 
-    problem = api.problem.get_problem(pid)
     assigned_instance = api.problem.get_instance_data(pid, tid)
 
     suspicious = False
@@ -49,6 +48,10 @@ def grade_problem(pid, key, tid=None):
     if not correct and DEBUG_KEY is not None:
         correct = DEBUG_KEY in key
     if not correct:
+        # Only the other instances' flags are needed to detect sharing
+        problem = api.problem.get_problem(
+            pid, {"instances.iid": 1, "instances.flag": 1}
+        )
         other_instance_flags = [
             instance["flag"]
             for instance in problem["instances"]
@@ -190,8 +193,18 @@ def get_submissions(
 def get_suspicious_submissions(tid):
     """Get the suspicious submissions for a given team."""
     submissions = get_submissions(tid=tid, suspicious=True)
+
+    # Look up the names of all of the flagged problems at once
+    db = api.db.get_conn()
+    problem_names = {
+        problem["pid"]: problem["name"]
+        for problem in db.problems.find(
+            {"pid": {"$in": list({s["pid"] for s in submissions})}},
+            {"_id": 0, "pid": 1, "name": 1},
+        )
+    }
     for submission in submissions:
-        submission["problem_name"] = api.problem.get_problem(submission["pid"])["name"]
+        submission["problem_name"] = problem_names[submission["pid"]]
     return submissions
 
 
@@ -199,7 +212,7 @@ def clear_all_submissions():
     """Remove all submissions from the database."""
     if DEBUG_KEY is not None:
         db = api.db.get_conn()
-        db.submissions.remove()
+        db.submissions.delete_many({})
         api.cache.clear()
     else:
         raise PicoException("Debug mode must be enabled", 500)
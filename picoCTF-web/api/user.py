@@ -678,6 +678,7 @@ def can_leave_team(uid):
         return False
     if current_team["creator"] == uid and current_team["size"] != 1:
         return False
-    if len(api.submissions.get_submissions(uid=uid)) > 0:
+    db = api.db.get_conn()
+    if db.submissions.find_one({"uid": uid}, {"_id": 1}) is not None:
         return False
     return True